@@ -0,0 +1,51 @@
+# aui-core/src/auicore/config.py
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+
+_DEFAULT_MODE = "pc"
+_DEFAULT_APP = "demo"
+_DEFAULT_TTS_LANG = "de"
+_DEFAULT_TTS_RATE = 1.0
+_DEFAULT_TTS_VOL = 1.0
+
+
+def _as_float(raw: Optional[str], default: float) -> float:
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Einmalig beim Prozessstart eingelesene Umgebungskonfiguration."""
+
+    mode: str = _DEFAULT_MODE
+    app: str = _DEFAULT_APP
+    tts_lang: str = _DEFAULT_TTS_LANG
+    tts_rate: float = _DEFAULT_TTS_RATE
+    tts_vol: float = _DEFAULT_TTS_VOL
+    entrypoint_group: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Liest alle AUI_*-Variablen genau einmal und normalisiert die Werte."""
+        e = os.environ if env is None else env
+        return cls(
+            mode=e.get("AUI_MODE", _DEFAULT_MODE).lower(),
+            app=e.get("AUI_APP", _DEFAULT_APP),
+            tts_lang=e.get("AUI_TTS_LANG", _DEFAULT_TTS_LANG),
+            tts_rate=_as_float(e.get("AUI_TTS_RATE"), _DEFAULT_TTS_RATE),
+            tts_vol=_as_float(e.get("AUI_TTS_VOL"), _DEFAULT_TTS_VOL),
+            entrypoint_group=e.get("AUI_ENTRYPOINT_GROUP"),
+        )
+
+
+# Prozessweit einmal gebaut; Tests können Settings.from_env(env=...) nutzen.
+settings = Settings.from_env()
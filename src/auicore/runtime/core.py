@@ -3,18 +3,26 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Sequence, Optional
-
-from .orchestrator import Orchestrator
-from auicommon.input.dtmf import DtmfKey
-from auicommon.input.dtmf_tone import DtmfTone
+import re
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Final, Sequence, Optional, TYPE_CHECKING
 
 # For generate_tone
 import math
 import struct
 from dataclasses import dataclass
-from auicommon.audio.types import PcmAudio, AudioFormat
+
+from auicore.config import settings
+
+# Schwere Importe (Orchestrator zieht auicommon + Plugin-Registry nach sich)
+# werden erst beim tatsächlichen Start geladen, damit z. B. `--help` nicht
+# den kompletten Plugin-Stack importiert.
+if TYPE_CHECKING:
+    from auicommon.audio.types import PcmAudio
 
 # ---------------------------
 # Logging (OO)
@@ -26,13 +34,18 @@ class LogConfig:
     datefmt: Optional[str] = None
 
 class LoggerFactory:
+    _configured = False  # prozessweit: basicConfig nur einmal anfassen
+
     def __init__(self, cfg: LogConfig) -> None:
         self._cfg = cfg
 
     def configure_root(self) -> None:
+        if LoggerFactory._configured:
+            return
         logging.basicConfig(level=self._cfg.level,
                             format=self._cfg.fmt,
                             datefmt=self._cfg.datefmt)
+        LoggerFactory._configured = True
 
     def get(self, name: str) -> logging.Logger:
         return logging.getLogger(name)
@@ -43,8 +56,9 @@ class LoggerFactory:
 # ---------------------------
 @dataclass(frozen=True)
 class CoreConfig:
-    app: str = "demo"
-    adapter: str = "pc"
+    # Defaults kommen aus der einmal eingelesenen Umgebung (auicore.config).
+    app: str = settings.app
+    adapter: str = settings.mode
     tts: str = "piper"
 
     @classmethod
@@ -60,18 +74,178 @@ class CoreConfig:
         return cls(app=ns.app, adapter=ns.adapter, tts=ns.tts)
 
 
+# ---------------------------
+# DTMF-Puffer & Prompt-Primitiven (OO)
+# ---------------------------
+@dataclass(frozen=True, slots=True)
+class InputEvent:
+    ts: float
+    kind: str
+    value: str
+
+
+# Gültige DTMF-Zeichen; das Dict normalisiert a-d → A-D in einem O(1)-Lookup
+# (statt Substring-Suche plus str.upper-Allokation pro Taste). kind/value
+# sind interniert, damit Vergleiche auf Pointer-Gleichheit hinauslaufen.
+_KIND_DIGIT: Final[str] = sys.intern("digit")
+_DTMF_VALID: Final[frozenset[str]] = frozenset("0123456789*#ABCDabcd")
+_DTMF_UPPER: Final[dict[str, str]] = {c: sys.intern(c.upper()) for c in _DTMF_VALID}
+
+
+class DigitBuffer:
+    """Minimaler, threadsicherer DTMF-Puffer (Producer: Adapter, Consumer: Prompt).
+
+    SPSC-Design ohne eigenes Lock: deque.append/popleft sind unter dem GIL
+    atomar, ein einzelnes Event dient nur als Wecker für wartende Prompts.
+    """
+
+    def __init__(self) -> None:
+        self._q: deque[InputEvent] = deque()
+        self._ev = threading.Event()
+
+    def push_digit(self, digit: str) -> None:
+        d = _DTMF_UPPER.get(digit)
+        if d is None:
+            return  # kein DTMF-Zeichen: still verwerfen
+        q = self._q
+        was_empty = not q
+        q.append(InputEvent(time.monotonic(), _KIND_DIGIT, d))
+        if was_empty:
+            # Nur beim Übergang leer→nicht-leer wecken: der Consumer prüft
+            # die Queue ohnehin, bevor er wartet, weitere Digits eines
+            # Bursts brauchen keinen zusätzlichen set()-Aufruf.
+            self._ev.set()
+
+    def pop(self) -> Optional[str]:
+        """Ältestes Digit entnehmen (None, wenn Puffer leer)."""
+        try:
+            return self._q.popleft().value
+        except IndexError:
+            return None
+
+    def has_digit(self) -> bool:
+        return bool(self._q)
+
+    def wait_nonempty(self, deadline: float) -> bool:
+        """Bis deadline (time.monotonic) auf ein Event warten; True bei Eingabe."""
+        # Heiße Lookups einmal binden statt pro Schleifendurchlauf.
+        q = self._q
+        ev_wait = self._ev.wait
+        ev_clear = self._ev.clear
+        monotonic = time.monotonic
+        while not q:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return False
+            ev_wait(timeout=remaining)
+            # Nach dem Wecken zurücksetzen; die while-Schleife prüft die
+            # Queue erneut, verpasste set()-Aufrufe sind damit unkritisch.
+            ev_clear()
+        return True
+
+    def drain_digits(self) -> str:
+        """Alle gepufferten Digits als String entnehmen (atomarer Swap)."""
+        old, self._q = self._q, deque()
+        return "".join(e.value for e in old)
+
+    def clear(self) -> None:
+        self._q.clear()
+        self._ev.clear()
+
+
+@dataclass(slots=True)
+class AppContext:
+    """Laufzeit-Kontext für Prompts: DTMF-Puffer plus gebundene Dienste."""
+
+    digit_buffer: DigitBuffer = field(default_factory=DigitBuffer)
+    adapter: Optional[Any] = None
+    tts: Optional[Any] = None
+
+
+class App:
+    """Minimaler App-Rahmen: bindet Adapter/TTS an den Context."""
+
+    def __init__(self, ctx: AppContext) -> None:
+        self._ctx = ctx
+        self._running = False
+
+    def bind_adapter(self, adapter: Any) -> None:
+        self._ctx.adapter = adapter
+
+    def bind_tts(self, tts: Any) -> None:
+        self._ctx.tts = tts
+
+    def start(self) -> None:
+        self._running = True
+
+    def stop(self) -> None:
+        self._running = False
+        self._ctx.digit_buffer.clear()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+
+# Ein-Pass-Ersetzung für sprechbare Sonderzeichen (statt verketteter
+# str.replace-Aufrufe, die den Text mehrfach kopieren).
+_STAR_HASH_RE: Final = re.compile(r"[*#]")
+_STAR_HASH_MAP: Final[dict[str, str]] = {"*": " Stern ", "#": " Raute "}
+
+
+def map_star_hash(text: str) -> str:
+    """'*' und '#' durch sprechbare Wörter ersetzen (ein Durchlauf)."""
+    if "*" not in text and "#" not in text:
+        return text  # häufigster Fall: keine Allokation
+    return _STAR_HASH_RE.sub(lambda m: _STAR_HASH_MAP[m.group()], text)
+
+
+def cancellable_say(ctx: AppContext, text: str, *,
+                    cancel_on_input: bool = True,
+                    max_speak_secs: float = 1.0) -> None:
+    """Text sprechen; eine DTMF-Eingabe bricht die Ausgabe sofort ab.
+
+    Statt den Puffer zu pollen wird genau einmal ereignisbasiert auf der
+    Condition des DigitBuffer gewartet (bis max_speak_secs erreicht ist).
+    """
+    tts = ctx.tts
+    if tts is not None:
+        tts.say(map_star_hash(text))
+    if not cancel_on_input:
+        return
+    deadline = time.monotonic() + max_speak_secs
+    if ctx.digit_buffer.wait_nonempty(deadline):
+        if tts is not None:
+            tts.stop()
+        stop_speak = getattr(ctx.adapter, "stop_speak", None)
+        if stop_speak is not None:
+            stop_speak()
+
+
+def say_and_get_digit(ctx: AppContext, text: str, *,
+                      timeout: float = 5.0) -> Optional[str]:
+    """Prompt sprechen und auf genau ein Digit warten (None bei Timeout)."""
+    cancellable_say(ctx, text, cancel_on_input=True)
+    deadline = time.monotonic() + timeout
+    if ctx.digit_buffer.wait_nonempty(deadline):
+        return ctx.digit_buffer.pop()
+    return None
+
+
 # ---------------------------
 # Core-Anwendung (OO)
 # ---------------------------
 class CoreApp:
     def __init__(self, cfg: CoreConfig, logger_factory: LoggerFactory) -> None:
+        from .orchestrator import Orchestrator
+
         self._cfg = cfg
         self._log = logger_factory.get("auicore")
         self._orch = Orchestrator()
 
     def run(self) -> int:
         try:
-            asyncio.run(self._amain())
+            self._run_loop(self._amain())
             return 0
         except KeyboardInterrupt:
             return 130
@@ -79,32 +253,55 @@ class CoreApp:
             self._log.exception("Fatal in CoreApp")
             return 1
 
+    @staticmethod
+    def _run_loop(coro) -> None:
+        """Coroutine mit uvloop ausführen, falls verfügbar (sonst stdlib asyncio)."""
+        try:
+            import uvloop  # optional, nicht auf Windows
+        except ImportError:
+            asyncio.run(coro)
+        else:
+            uvloop.run(coro)
+
     async def _amain(self) -> None:
+        from auicommon.audio.types import AudioFormat
+        from auicommon.input.dtmf import DtmfKey
+        from auicommon.input.dtmf_tone import DtmfTone
+
         self._log.info("CoreApp started")
         self._log.info("Config: app=%s adapter=%s tts=%s",
                        self._cfg.app, self._cfg.adapter, self._cfg.tts)
 
         # (A) Verfügbare Plugins je Domäne ausgeben (wie bisher)
-        manager_list = self._orch.list_all()
-        print(manager_list)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Verfügbare Plugins: %s", self._orch.list_all())
 
         # (B) Nur den Adapter über den Orchestrator setzen (pc o. konfiguriert)
         try:
             await self._orch.select_backends(adapter=self._cfg.adapter)
-        except Exception as e:
-            print(e)
+        except Exception:
+            self._log.exception("select_backends fehlgeschlagen")
 
         # (C) Aktuelle Adapter-Instanz ausgeben (wie bisher)
-        print(self._orch.adapters.current)
-        print(self._orch.adapters.current.meta())
+        if self._log.isEnabledFor(logging.DEBUG):
+            cur = self._orch.adapters.current
+            self._log.debug("Adapter: %r meta=%s", cur, cur.meta())
+        current = self._orch.adapters.current
+        # Ereignisbasiert warten, wenn der Adapter next_dtmf() anbietet;
+        # sonst Poll-Fallback (nur schlafen, wenn wirklich keine Taste kam).
+        next_dtmf = getattr(current, "next_dtmf", None)
         running = True
         while running:
-            key = await self._orch.adapters.current.get_dtmf_key()
-            if key is not None:
-                await self._orch.adapters.current.play(DtmfTone.make(key = key, audio_format=AudioFormat(rate=22000)))
-                if key in (DtmfKey.KEY_STAR, DtmfKey.KEY_HASH):
-                    running = False
-            await asyncio.sleep(0.2)
+            if next_dtmf is not None:
+                key = await next_dtmf()
+            else:
+                key = await current.get_dtmf_key()
+                if key is None:
+                    await asyncio.sleep(0.2)
+                    continue
+            await current.play(DtmfTone.make(key=key, audio_format=AudioFormat(rate=22000)))
+            if key in (DtmfKey.KEY_STAR, DtmfKey.KEY_HASH):
+                running = False
         # Keine App/TTS starten – nur Demonstration
         # Geordneter Shutdown des gesetzten Adapters
         await self._orch.shutdown()
@@ -129,16 +326,38 @@ if __name__ == "__main__":
     raise SystemExit(main())
 
 
+def _numpy():
+    """Optionales numpy laden (None, wenn nicht installiert)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 def generate_tone(freq: float = 440.0,
                   duration: float = 2.0,
                   samplerate: int = 8000,
                   channels: int = 1,
                   width: int = 2) -> PcmAudio:
     """Generate a sine wave tone as PcmAudio (default: 440 Hz, 2 s, 8 kHz mono, 16-bit)."""
+    from auicommon.audio.types import PcmAudio
+
     num_samples = int(samplerate * duration)
     amplitude = (2 ** (width * 8 - 1)) - 1  # e.g. 32767 for 16-bit
-    pcm_frames = []
 
+    np = _numpy()
+    if np is not None:
+        # Vektorisiert: ein sin()-Aufruf über das ganze Array statt
+        # num_samples Python-Iterationen mit struct.pack.
+        t = np.arange(num_samples, dtype=np.float64) / samplerate
+        samples = np.rint(amplitude * np.sin(2.0 * np.pi * freq * t)).astype("<i2")
+        if channels > 1:
+            samples = np.repeat(samples[:, None], channels, axis=1)
+        return PcmAudio(data=samples.tobytes(), rate=samplerate,
+                        channels=channels, width=width)
+
+    pcm_frames = []
     for n in range(num_samples):
         # Normalisierte Zeit
         t = n / samplerate
@@ -158,15 +377,30 @@ def generate_chirp(f_start: float = 440.0,
                    channels: int = 1,
                    width: int = 2) -> PcmAudio:
     """Generate a linear chirp (frequency sweep) as PcmAudio."""
+    from auicommon.audio.types import PcmAudio
+
     num_samples = int(samplerate * duration)
     amplitude = (2 ** (width * 8 - 1)) - 1  # z. B. 32767 für 16-bit
-    pcm_frames = []
 
+    # Lineare Chirp-Phase: φ(t) = 2π·(f_start·t + k/2·t²) mit k = Δf/T.
+    # sin(2π·f(t)·t) wäre falsch (Momentanfrequenz liefe bis 2·f_end−f_start).
+    k = (f_end - f_start) / duration
+
+    np = _numpy()
+    if np is not None:
+        t = np.arange(num_samples, dtype=np.float64) / samplerate
+        phase = 2.0 * np.pi * (f_start * t + 0.5 * k * t * t)
+        samples = np.rint(amplitude * np.sin(phase)).astype("<i2")
+        if channels > 1:
+            samples = np.repeat(samples[:, None], channels, axis=1)
+        return PcmAudio(data=samples.tobytes(), rate=samplerate,
+                        channels=channels, width=width)
+
+    pcm_frames = []
     for n in range(num_samples):
         t = n / samplerate
-        # lineare Frequenzsteigerung von f_start nach f_end
-        f_t = f_start + (f_end - f_start) * (t / duration)
-        sample = int(amplitude * math.sin(2 * math.pi * f_t * t))
+        phase = 2 * math.pi * (f_start * t + 0.5 * k * t * t)
+        sample = int(amplitude * math.sin(phase))
         frame = struct.pack("<" + "h" * channels, *([sample] * channels))
         pcm_frames.append(frame)
 
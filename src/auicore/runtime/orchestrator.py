@@ -70,13 +70,16 @@ class Orchestrator:
     ) -> None:
         """
         Wählt (und startet) je ein Backend pro Domäne (sofern angegeben).
-        Reihenfolge: zuerst Adapter, dann TTS.
+        Adapter und TTS sind voneinander unabhängig und starten parallel.
         """
         async with self._lock:
-            if adapter:
-                await self.adapters.set_current(adapter, **(adapter_kwargs or {}))
-            if tts:
-                await self.tts.set_current(tts, **(tts_kwargs or {}))
+            async with asyncio.TaskGroup() as tg:
+                if adapter:
+                    tg.create_task(
+                        self.adapters.set_current(adapter, **(adapter_kwargs or {}))
+                    )
+                if tts:
+                    tg.create_task(self.tts.set_current(tts, **(tts_kwargs or {})))
 
             # Kontext neu aufbauen, falls beide vorhanden
             if self.adapters.current and self.tts.current:
@@ -120,27 +123,32 @@ class Orchestrator:
     # ---------------------------------------------------------------------
     async def shutdown(self) -> None:
         """
-        Stoppt App, dann TTS, dann Adapter – in dieser Reihenfolge.
+        Stoppt zuerst die App (Ordnungs-Invariante), danach TTS und Adapter
+        parallel mit Timeout pro Backend – ein hängendes TTS blockiert so
+        nicht mehr den Adapter-Shutdown.
         """
         async with self._lock:
             await self._stop_app_locked()
 
-            # Backends geordnet stoppen (falls Manager Start/Stop delegieren)
-            if self.tts.current:
-                try:
-                    await self.tts.current.stop()
-                except Exception:  # nüchtern: Fehler loggen, weiter fahren
-                    log.exception("TTS stop failed")
-
-            if self.adapters.current:
-                try:
-                    await self.adapters.current.stop()
-                except Exception:
-                    log.exception("Adapter stop failed")
+            backends = [
+                ("TTS", self.tts.current),
+                ("Adapter", self.adapters.current),
+            ]
+            await asyncio.gather(
+                *(self._stop_backend(name, b) for name, b in backends if b)
+            )
 
             self._ctx = None
             log.info("Orchestrator shutdown complete.")
 
+    @staticmethod
+    async def _stop_backend(name: str, backend, timeout: float = 2.0) -> None:
+        """Backend mit Timeout stoppen; Fehler nüchtern loggen, weiter fahren."""
+        try:
+            await asyncio.wait_for(backend.stop(), timeout)
+        except Exception:  # inkl. TimeoutError
+            log.exception("%s stop failed", name)
+
     # ---------------------------------------------------------------------
     # Internals
     # ---------------------------------------------------------------------
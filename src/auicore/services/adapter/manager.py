@@ -17,10 +17,14 @@ class AdapterManager:
         self._reg = PluginRegistry[AdapterService](groups=("aui.adapters",), contract=AdapterService)
         self._current: Optional[AdapterService] = None
         self._current_name: Optional[str] = None
+        self._names: Optional[list[str]] = None
         self._lock = asyncio.Lock()
 
     def list(self, *, refresh: bool = False) -> list[str]:
-        return self._reg.list(refresh=refresh)
+        """Namen der bekannten Plugins; Registry-Scan nur beim ersten Mal bzw. refresh."""
+        if refresh or self._names is None:
+            self._names = self._reg.list(refresh=refresh)
+        return list(self._names)
 
     def make(self, name: str, **kwargs: Any) -> AdapterService:
         """Nur Instanziierung (ohne init/start)."""
@@ -55,8 +59,8 @@ class AdapterManager:
 
             try:
                 await inst.start()
-            except Exception as e:
-                print (f"Adapter konnte nicht gestartet werden: {e}")
+            except Exception:
+                log.exception("Adapter konnte nicht gestartet werden: %s", name)
             self._current, self._current_name = inst, name
             log.info("Adapter aktiv: %s", name)
 
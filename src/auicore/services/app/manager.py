@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
 
 from auicommon.pluginmanager import PluginRegistry
 from auicommon.app.base import AppService
@@ -15,21 +16,35 @@ class AppManager:
 
     def __init__(self) -> None:
         self._reg = PluginRegistry[AppService](groups=("aui.app",), contract=AppService)
+        self._names: Optional[list[str]] = None
 
     def list(self, *, refresh: bool = False) -> list[str]:
-        return self._reg.list(refresh=refresh)
+        """Namen der bekannten Plugins; Registry-Scan nur beim ersten Mal bzw. refresh."""
+        if refresh or self._names is None:
+            self._names = self._reg.list(refresh=refresh)
+        return list(self._names)
 
     def make(self, name: str, **kwargs: Any) -> AppService:
         """Instanziiert eine App (ohne init/start)."""
         return self._reg.make(name, **kwargs)
 
     def list_meta(self, *, refresh: bool = False) -> List[AppMeta]:
-        """Instanziiert jede App einmal, liest meta() (leichtgewichtig), gibt Metadaten zurück."""
-        metas: List[AppMeta] = []
-        for n in self.list(refresh=refresh):
+        """Instanziiert jede App einmal, liest meta() (leichtgewichtig), gibt Metadaten zurück.
+
+        Die Plugin-Importe laufen parallel in einem kleinen Thread-Pool;
+        bei vielen Apps mit schweren Importen dominiert sonst der serielle
+        Import die Startzeit.
+        """
+        names = self.list(refresh=refresh)
+        if not names:
+            return []
+
+        def _meta_of(name: str) -> Optional[AppMeta]:
             try:
-                app = self._reg.make(n)
-                metas.append(app.meta())
+                return self._reg.make(name).meta()
             except Exception:
-                log.exception("meta() von App '%s' fehlgeschlagen", n)
-        return metas
+                log.exception("meta() von App '%s' fehlgeschlagen", name)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+            return [m for m in pool.map(_meta_of, names) if m is not None]
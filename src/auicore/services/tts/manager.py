@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from auicommon.pluginmanager import PluginRegistry
 from auicommon.tts.base import TtsService
@@ -15,12 +15,44 @@ class TtsManager:
 
     def __init__(self) -> None:
         self._reg = PluginRegistry[TtsService](groups=("aui.tts_backend",), contract=TtsService)
-        self._current: Optional[TtsService] = None
-        self._current_name: Optional[str] = None
+        # Aktive Instanz samt Name als ein Tupel: ein Attributzugriff,
+        # und (Instanz, Name) sind immer konsistent zueinander.
+        self._active: Optional[tuple[TtsService, str]] = None
+        self._names: Optional[list[str]] = None
+        self._names_set: Optional[frozenset[str]] = None
         self._lock = asyncio.Lock()
+        self._switch_task: Optional[asyncio.Task] = None
+        self._preloaded: dict[str, TtsService] = {}
+        # Obergrenze für gleichzeitiges Vorwärmen (große Modelle!).
+        self._preload_sem = asyncio.Semaphore(3)
+
+    def names(self) -> list[str]:
+        """Gecachte Namensliste; scannt die Registry nur beim ersten Aufruf."""
+        if self._names is None:
+            self._names = self._reg.list()
+            self._names_set = frozenset(self._names)
+        return list(self._names)
+
+    def refresh_names(self) -> list[str]:
+        """Registry neu scannen und den Cache ersetzen."""
+        self._names = self._reg.list(refresh=True)
+        self._names_set = frozenset(self._names)
+        return list(self._names)
 
     def list(self, *, refresh: bool = False) -> list[str]:
-        return self._reg.list(refresh=refresh)
+        """Kompatibilitäts-Wrapper; neue Aufrufer nutzen names()/refresh_names()."""
+        return self.refresh_names() if refresh else self.names()
+
+    def exists(self, name: str) -> bool:
+        """Synchroner Membership-Check (O(1) bei warmem Cache, kein Event-Loop nötig)."""
+        if self._names_set is None:
+            self.list()
+        return name in self._names_set  # type: ignore[operator]
+
+    def invalidate(self) -> None:
+        """Namens-Cache verwerfen; das nächste list() scannt die Registry neu."""
+        self._names = None
+        self._names_set = None
 
     def make(self, name: str, **kwargs: Any) -> TtsService:
         """Nur Instanziierung (ohne init/start)."""
@@ -28,37 +60,135 @@ class TtsManager:
 
     @property
     def current(self) -> Optional[TtsService]:
-        return self._current
+        active = self._active
+        return active[0] if active else None
 
     @property
     def current_name(self) -> Optional[str]:
-        return self._current_name
+        active = self._active
+        return active[1] if active else None
 
     async def set_current(self, name: str, *, init_kwargs: Optional[dict[str, Any]] = None) -> None:
         """Aktives TTS wechseln (alt stop, neu init+start)."""
+        # Fast path ohne Lock für den häufigen No-op-Fall; unter dem Lock
+        # wird erneut geprüft (double-checked locking).
+        if self._active is not None and self._active[1] == name:
+            return
+        # Einen laufenden Wechsel abbrechen (Barge-in), statt sich hinter
+        # einem hängenden init/start einzureihen.
+        await self.cancel_switch()
         async with self._lock:
-            if self._current_name == name:
+            if self._active is not None and self._active[1] == name:
                 return
-            if self._current:
+            task = asyncio.create_task(self._do_switch(name, init_kwargs))
+            self._switch_task = task
+            try:
+                await task
+            finally:
+                if self._switch_task is task:
+                    self._switch_task = None
+
+    async def preload(self, names: Iterable[str]) -> None:
+        """Backends nebenläufig vorwärmen (make + optionales preload()).
+
+        Vorgewärmte Instanzen übernimmt der nächste set_current für den
+        jeweiligen Namen, statt neu zu bauen; Fehler einzelner Backends
+        werden geloggt und brechen die übrigen nicht ab.
+        """
+        async def _one(n: str) -> None:
+            async with self._preload_sem:
                 try:
-                    await self._current.stop()
+                    inst = await asyncio.to_thread(self._reg.make, n)
+                    pre = getattr(inst, "preload", None)
+                    if pre is not None:
+                        await pre()
+                    self._preloaded[n] = inst
                 except Exception:
-                    log.exception("Stop des bisherigen TTS schlug fehl")
+                    log.exception("Preload von TTS '%s' fehlgeschlagen", n)
+
+        await asyncio.gather(*(_one(n) for n in names))
+
+    def set_concurrency(self, n: int) -> None:
+        """Maximale Zahl gleichzeitig vorgewärmter Backends einstellen."""
+        if n < 1:
+            raise ValueError("concurrency muss >= 1 sein")
+        self._preload_sem = asyncio.Semaphore(n)
 
-            inst = self._reg.make(name)
-            if init_kwargs:
-                await inst.init(**init_kwargs)
-            await inst.start()
-            self._current, self._current_name = inst, name
+    async def cancel_switch(self) -> None:
+        """Einen in-flight set_current abbrechen (No-op, wenn keiner läuft)."""
+        task = self._switch_task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _do_switch(self, name: str, init_kwargs: Optional[dict[str, Any]]) -> None:
+        """Eigentlicher Backend-Wechsel; läuft als cancelbarer Task unter self._lock."""
+        stop_task: Optional[asyncio.Task] = None
+        if self._active is not None:
+            # Stop des alten Backends parallel zum Aufbau des neuen anstoßen;
+            # die Stop-Latenz (z. B. Engine-Teardown) wird so verdeckt.
+            old = self._active[0]
+            self._active = None
+            stop_task = asyncio.create_task(self._stop_old(old))
+
+        try:
+            inst = self._preloaded.pop(name, None)
+            if inst is None:
+                try:
+                    inst = self._reg.make(name)
+                except KeyError:
+                    # Unbekannter Name: Cache verwerfen, damit ein Retry nach
+                    # list(refresh=True) frisch installierte Plugins sieht.
+                    self.invalidate()
+                    raise
+            try:
+                if init_kwargs:
+                    await inst.init(**init_kwargs)
+                # Vor start() muss der alte Stop fertig sein (Audio-Gerät/
+                # Engine erst dann sicher frei).
+                if stop_task is not None:
+                    await asyncio.shield(stop_task)
+                await inst.start()
+            except asyncio.CancelledError:
+                # Teilgestartete Instanz geschirmt aufräumen, dann Abbruch
+                # weiterreichen.
+                try:
+                    await asyncio.shield(inst.stop())
+                except Exception:
+                    log.exception("Stop der teilgestarteten TTS-Instanz schlug fehl")
+                raise
+        finally:
+            if stop_task is not None and not stop_task.done():
+                await asyncio.gather(stop_task, return_exceptions=True)
+
+        self._active = (inst, name)
+        if log.isEnabledFor(logging.INFO):
             log.info("TTS aktiv: %s", name)
 
+    @staticmethod
+    async def _stop_old(old: TtsService) -> None:
+        try:
+            await old.stop()
+        except Exception:
+            log.exception("Stop des bisherigen TTS schlug fehl")
+
     async def stop_current(self) -> None:
+        if self._active is None:  # Fast path: nichts aktiv, Lock sparen
+            return
         async with self._lock:
-            if not self._current:
+            if self._active is None:
                 return
+            # Erst Zustand lösen, dann stoppen: während des await sieht kein
+            # paralleler Aufrufer mehr eine scheinbar aktive Instanz.
+            cur, name = self._active
+            self._active = None
             try:
-                await self._current.stop()
-            finally:
-                log.info("TTS gestoppt: %s", self._current_name)
-                self._current = None
-                self._current_name = None
+                await cur.stop()
+            except Exception:
+                log.exception("Stop von TTS '%s' schlug fehl", name)
+            if log.isEnabledFor(logging.INFO):
+                # Log-Dispatch (inkl. Handler-Lock) vom Stop-Pfad abkoppeln:
+                # der Aufrufer kehrt zurück, geloggt wird im nächsten Tick.
+                asyncio.get_running_loop().call_soon(
+                    log.info, "TTS gestoppt: %s", name
+                )
@@ -1,5 +1,5 @@
 import time
-from auicore.runtime.core import App, AppContext
+from auicore.runtime.core import App, AppContext, say_and_get_digit
 
 class DummyAdapter:
     def __init__(self, ctx): self.ctx = ctx
@@ -15,13 +15,16 @@ class DummyTTS:
     def say(self, text: str) -> None: pass
     def stop(self) -> None: pass
 
+# Zustandslos; ein Modul-Singleton genügt für alle Tests.
+DUMMY_TTS = DummyTTS()
+
 def test_say_and_get_digit_basic():
     ctx = AppContext()
     app = App(ctx)
     app.bind_adapter(DummyAdapter(ctx))
-    app.bind_tts(DummyTTS())
+    app.bind_tts(DUMMY_TTS)
     app.start()
     # Simulate incoming digit after prompt
     ctx.digit_buffer.push_digit("5")
-    d = auicore.runtime.core.say_and_get_digit(ctx, "Enter digit:")
+    d = say_and_get_digit(ctx, "Enter digit:")
     assert d == "5"
\ No newline at end of file